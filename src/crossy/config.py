@@ -1,5 +1,7 @@
 """Game configuration constants."""
 
+from enum import IntEnum
+
 # Window settings
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
@@ -17,12 +19,22 @@ PLAYER_START_Y = TOTAL_ROWS - 3  # Start near the bottom of the world
 SCROLL_SPEED = 0.5  # Rows per second that the screen auto-scrolls upward
 SCROLL_THRESHOLD = 0.75  # Player position threshold (0.75 = 1/4 from bottom, 3/4 from top)
 SCROLL_CATCHUP_SPEED = 3.0  # Extra scroll speed when player is above threshold
+MOVE_REPEAT_DELAY = 0.12  # Seconds between moves while a direction key is held
 
 # Terrain generation
-TERRAIN_GRASS = "grass"
-TERRAIN_ROAD = "road"
-TERRAIN_RIVER = "river"
-TERRAIN_TRAIN = "train"
+class Terrain(IntEnum):
+    """Terrain types, int-valued so comparisons and dict hashing stay cheap."""
+    GRASS = 0
+    ROAD = 1
+    RIVER = 2
+    TRAIN = 3
+
+
+# Aliases for the terrain members, used throughout the codebase
+TERRAIN_GRASS = Terrain.GRASS
+TERRAIN_ROAD = Terrain.ROAD
+TERRAIN_RIVER = Terrain.RIVER
+TERRAIN_TRAIN = Terrain.TRAIN
 
 # Colors (R, G, B)
 COLOR_BACKGROUND = (50, 50, 50)
@@ -39,6 +51,14 @@ COLOR_TREE = (34, 100, 34)
 COLOR_TRAIN = (180, 40, 40)
 COLOR_TEXT = (255, 255, 255)
 
+# Terrain type -> base color lookup
+TERRAIN_COLORS = {
+    TERRAIN_GRASS: COLOR_GRASS,
+    TERRAIN_ROAD: COLOR_ROAD,
+    TERRAIN_RIVER: COLOR_RIVER,
+    TERRAIN_TRAIN: COLOR_TRAIN_TRACK,
+}
+
 # Obstacle settings
 CAR_SPEED_MIN = 1.0
 CAR_SPEED_MAX = 3.0
@@ -1,9 +1,9 @@
 """Game state management."""
 
-import os
+import atexit
 from crossy.config import (
-    GRID_WIDTH, GRID_HEIGHT, HIGH_SCORE_FILE,
-    TERRAIN_ROAD, TERRAIN_RIVER, TERRAIN_GRASS, TERRAIN_TRAIN, 
+    GRID_WIDTH, GRID_HEIGHT, TOTAL_ROWS, HIGH_SCORE_FILE,
+    TERRAIN_ROAD, TERRAIN_RIVER, TERRAIN_TRAIN,
     SCROLL_SPEED, SCROLL_THRESHOLD, SCROLL_CATCHUP_SPEED
 )
 from crossy.player import Player
@@ -25,6 +25,8 @@ class GameState:
         self.terrain_manager = TerrainManager()
         self.obstacle_manager = ObstacleManager()
         self.high_score = self._load_high_score()
+        self._hs_file = self._open_high_score_file()
+        self._hs_on_disk = self.high_score
         self.scroll_y = 0.0  # Current scroll position (in rows)
         
         # Generate initial obstacles
@@ -32,27 +34,43 @@ class GameState:
 
     def _load_high_score(self):
         """Load high score from file."""
+        # The file holds a single small integer: a bounded binary read
+        # avoids the stat-for-size dance and newline translation
         try:
-            if os.path.exists(HIGH_SCORE_FILE):
-                with open(HIGH_SCORE_FILE, 'r') as f:
-                    return int(f.read().strip())
-        except (ValueError, IOError):
-            pass
-        return 0
+            with open(HIGH_SCORE_FILE, 'rb') as f:
+                return int(f.read(32).strip() or 0)
+        except (FileNotFoundError, ValueError, IOError):
+            return 0
+
+    def _open_high_score_file(self):
+        """Open the high score file once and keep the handle for saves."""
+        try:
+            try:
+                f = open(HIGH_SCORE_FILE, 'r+')
+            except FileNotFoundError:
+                f = open(HIGH_SCORE_FILE, 'w+')
+        except IOError:
+            return None
+        atexit.register(f.close)
+        return f
 
     def _save_high_score(self):
-        """Save high score to file."""
+        """Save high score to file (only when it actually changed)."""
+        if self._hs_file is None or self.high_score == self._hs_on_disk:
+            return
         try:
-            with open(HIGH_SCORE_FILE, 'w') as f:
-                f.write(str(self.high_score))
+            self._hs_file.seek(0)
+            self._hs_file.truncate()
+            self._hs_file.write(str(self.high_score))
+            self._hs_file.flush()
+            self._hs_on_disk = self.high_score
         except IOError:
             pass
 
     def _generate_initial_obstacles(self):
         """Generate obstacles for all initial terrain rows."""
-        for i, row in enumerate(self.terrain_manager.rows):
-            if row.terrain_type in (TERRAIN_ROAD, TERRAIN_RIVER, TERRAIN_GRASS, TERRAIN_TRAIN):
-                self.obstacle_manager.generate_for_row(i, row.terrain_type)
+        for i, terrain_type in enumerate(self.terrain_manager.terrain_types):
+            self.obstacle_manager.generate_for_row(i, terrain_type)
 
     def start_game(self):
         """Start a new game."""
@@ -73,6 +91,13 @@ class GameState:
         if self.state != self.STATE_PLAYING:
             return
 
+        # Skip degenerate frames (window drag/minimize can stall the clock)
+        if dt <= 0.0:
+            return
+        # Clamp huge steps so a pause can't teleport things through each other
+        if dt > 0.1:
+            dt = 0.1
+
         # Auto-scroll upward over time
         self.scroll_y -= SCROLL_SPEED * dt  # Negative because lower y = further up
         
@@ -128,8 +153,6 @@ class GameState:
             dy: Change in y
         """
         if self.state == self.STATE_PLAYING:
-            from crossy.config import TOTAL_ROWS
-            
             # Calculate the target position
             target_x = int(self.player.x) + dx
             target_y = int(self.player.y) + dy
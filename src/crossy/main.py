@@ -1,12 +1,12 @@
 """Main game entry point and game loop."""
 
 import pygame
+from math import floor
 from crossy.config import (
     WINDOW_WIDTH, WINDOW_HEIGHT, FPS, CELL_SIZE,
     GRID_WIDTH, GRID_HEIGHT,
-    COLOR_BACKGROUND, COLOR_GRASS, COLOR_ROAD, COLOR_RIVER, COLOR_TRAIN_TRACK,
-    COLOR_PLAYER, COLOR_TEXT, COLOR_TREE,
-    TERRAIN_GRASS, TERRAIN_ROAD, TERRAIN_RIVER, TERRAIN_TRAIN,
+    COLOR_BACKGROUND, COLOR_PLAYER, COLOR_TEXT, COLOR_TREE, TERRAIN_COLORS,
+    TERRAIN_TRAIN, MOVE_REPEAT_DELAY,
     DEBUG_HITBOX_COLOR
 )
 from crossy.game import GameState
@@ -16,11 +16,37 @@ from crossy.obstacles import Car, Log, Tree, Train
 class Game:
     """Main game class handling the game loop and rendering."""
 
+    # Movement keys polled each frame, in priority order
+    MOVE_KEYS = (
+        (pygame.K_UP, 0, -1),
+        (pygame.K_DOWN, 0, 1),
+        (pygame.K_LEFT, -1, 0),
+        (pygame.K_RIGHT, 1, 0),
+    )
+
     def __init__(self):
         """Initialize the game."""
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        try:
+            # Prefer the GPU-accelerated scaled path with vsync pacing
+            self.screen = pygame.display.set_mode(
+                (WINDOW_WIDTH, WINDOW_HEIGHT),
+                pygame.SCALED | pygame.DOUBLEBUF,
+                vsync=1
+            )
+        except pygame.error:
+            # Headless/older drivers reject accelerated modes; fall back
+            # to a plain software surface
+            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Crossy Road Clone")
+
+        # Only QUIT and KEYDOWN are ever consumed from the queue; blocking
+        # everything else (notably high-rate mouse motion) keeps it short.
+        # Key polling is unaffected since it reads the keyboard state, not
+        # queued events
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
         self.clock = pygame.time.Clock()
         self.running = True
         
@@ -29,216 +55,361 @@ class Game:
         
         self.game_state = GameState()
         self.debug_mode = False  # Toggle with 'D' key
+        self._key_actions = self._build_key_actions()
+        self._move_cooldown = 0.0  # Time until the next held-key move
+
+        self._row_surfaces = self._build_row_surfaces()
+        self._obstacle_surfaces = {}  # (color, width_px) -> Surface
+
+        # Tree sprite rasterized once with per-pixel alpha and blitted,
+        # instead of a draw.circle call per tree per frame
+        self._tree_surface = pygame.Surface(
+            (CELL_SIZE, CELL_SIZE), pygame.SRCALPHA
+        ).convert_alpha()
+        pygame.draw.circle(
+            self._tree_surface, COLOR_TREE,
+            (CELL_SIZE // 2, CELL_SIZE // 2), CELL_SIZE // 3
+        )
+
+        # Train warning flash overlay, built once in display format
+        self._warning_overlay = pygame.Surface(
+            (GRID_WIDTH * CELL_SIZE, CELL_SIZE)
+        ).convert()
+        self._warning_overlay.set_alpha(60)
+        self._warning_overlay.fill((255, 0, 0))
+
+        # Game-over dim overlay, built once instead of per frame
+        self._game_over_overlay = pygame.Surface(
+            (WINDOW_WIDTH, WINDOW_HEIGHT)
+        ).convert()
+        self._game_over_overlay.set_alpha(180)
+        self._game_over_overlay.fill((0, 0, 0))
+        self._game_over_snapshot = None  # Last playing frame, captured on death
+        self._static_screen_state = None  # State whose static frame is on screen
+        self._score_cache = (-1, None)  # (score, rendered Surface)
+        self._high_score_cache = (-1, None)  # (high score, rendered Surface)
+
+        # Static text surfaces, rendered once
+        self._debug_label = self.small_font.render(
+            "DEBUG MODE", True, DEBUG_HITBOX_COLOR
+        )
+        self._game_over_title = self.font.render("GAME OVER", True, COLOR_TEXT)
+        self._new_high_score_text = self.font.render(
+            "NEW HIGH SCORE!", True, (255, 215, 0)
+        )
+        self._restart_prompt = self.small_font.render(
+            "Press R to restart", True, COLOR_TEXT
+        )
+
+        # Static start-screen text, rendered once
+        self._start_title = self.font.render("CROSSY ROAD CLONE", True, COLOR_TEXT)
+        self._start_instructions = [
+            self.small_font.render(line, True, COLOR_TEXT)
+            for line in (
+                "Use ARROW KEYS to move",
+                "Avoid cars, ride logs across rivers",
+                "Trees block your path on grass",
+                "Watch for trains on tracks - they're fast!",
+                "Screen auto-scrolls - don't fall behind!",
+                "Press D to toggle debug hitboxes",
+                "",
+                "Press SPACE to start",
+            )
+        ]
+
+    def _get_obstacle_surface(self, color, width_px):
+        """
+        Get (or lazily build) a cached solid Surface for an obstacle.
+
+        Args:
+            color: RGB color tuple
+            width_px: Obstacle width in pixels
+
+        Returns:
+            Surface: Cached surface of the requested color and size
+        """
+        key = (color, width_px)
+        surface = self._obstacle_surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface((width_px, CELL_SIZE)).convert()
+            surface.fill(color)
+            self._obstacle_surfaces[key] = surface
+        return surface
+
+    def _build_row_surfaces(self):
+        """
+        Pre-render one full-width strip per terrain type.
+
+        Rows of the same terrain type look identical, so each strip is
+        rasterized once at startup and blitted per visible row instead of
+        filling a rect (and drawing rails) every frame.
+
+        Returns:
+            dict: Mapping of terrain type to row Surface
+        """
+        surfaces = {}
+        for terrain_type, color in TERRAIN_COLORS.items():
+            surface = pygame.Surface((GRID_WIDTH * CELL_SIZE, CELL_SIZE)).convert()
+            surface.fill(color)
+            surfaces[terrain_type] = surface
+
+        # Bake the two rails into the train strip
+        rail_color = (100, 80, 60)  # Slightly lighter brown for rails
+        rail_height = 3
+        train_surface = surfaces[TERRAIN_TRAIN]
+        for rail_y in (CELL_SIZE // 3, 2 * CELL_SIZE // 3):
+            pygame.draw.rect(
+                train_surface,
+                rail_color,
+                pygame.Rect(0, rail_y, GRID_WIDTH * CELL_SIZE, rail_height)
+            )
+
+        return surfaces
+
+    def _build_key_actions(self):
+        """
+        Build the (state, key) -> handler dispatch table.
+
+        A single dict lookup per keydown replaces the nested state/key
+        if/elif chains.
+
+        Returns:
+            dict: Mapping of (game state, key) to a zero-arg handler
+        """
+        game_state = self.game_state
+        return {
+            (GameState.STATE_START, pygame.K_SPACE): game_state.start_game,
+            (GameState.STATE_START, pygame.K_RETURN): game_state.start_game,
+            (GameState.STATE_PLAYING, pygame.K_d): self._toggle_debug,
+            (GameState.STATE_PLAYING, pygame.K_ESCAPE): self._quit,
+            (GameState.STATE_GAME_OVER, pygame.K_r): game_state.restart,
+            (GameState.STATE_GAME_OVER, pygame.K_ESCAPE): self._quit,
+        }
+
+    def _toggle_debug(self):
+        """Toggle debug hitbox rendering."""
+        self.debug_mode = not self.debug_mode
+        print(f"Debug mode: {'ON' if self.debug_mode else 'OFF'}")
+
+    def _quit(self):
+        """Stop the game loop."""
+        self.running = False
 
     def handle_events(self):
         """Handle pygame events."""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            elif event.type == pygame.KEYDOWN:
-                if self.game_state.state == GameState.STATE_START:
-                    if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                        self.game_state.start_game()
-                
-                elif self.game_state.state == GameState.STATE_PLAYING:
-                    if event.key == pygame.K_UP:
-                        self.game_state.move_player(0, -1)
-                    elif event.key == pygame.K_DOWN:
-                        self.game_state.move_player(0, 1)
-                    elif event.key == pygame.K_LEFT:
-                        self.game_state.move_player(-1, 0)
-                    elif event.key == pygame.K_RIGHT:
-                        self.game_state.move_player(1, 0)
-                    elif event.key == pygame.K_d:
-                        # Toggle debug mode
-                        self.debug_mode = not self.debug_mode
-                        print(f"Debug mode: {'ON' if self.debug_mode else 'OFF'}")
-                    elif event.key == pygame.K_ESCAPE:
-                        self.running = False
-                
-                elif self.game_state.state == GameState.STATE_GAME_OVER:
-                    if event.key == pygame.K_r:
-                        self.game_state.restart()
-                    elif event.key == pygame.K_ESCAPE:
-                        self.running = False
+            self._dispatch_event(event)
+
+    def _dispatch_event(self, event):
+        """Dispatch a single pygame event."""
+        if event.type == pygame.QUIT:
+            self.running = False
+
+        elif event.type == pygame.KEYDOWN:
+            action = self._key_actions.get((self.game_state.state, event.key))
+            if action is not None:
+                action()
+
+    def _poll_movement(self, dt):
+        """
+        Move the player based on held keys, with a per-move cooldown.
+
+        Polling the key state replaces per-keydown event dispatch for
+        movement and gives smooth held-key travel across the grid.
+
+        Args:
+            dt: Delta time in seconds
+        """
+        self._move_cooldown -= dt
+        keys = pygame.key.get_pressed()
+        held = False
+        for key, dx, dy in self.MOVE_KEYS:
+            if keys[key]:
+                held = True
+                if self._move_cooldown <= 0:
+                    self.game_state.move_player(dx, dy)
+                    self._move_cooldown = MOVE_REPEAT_DELAY
+                break
+        if not held:
+            # No direction held: make the next tap respond instantly
+            self._move_cooldown = 0.0
 
     def update(self, dt):
         """
         Update game state.
-        
+
         Args:
             dt: Delta time in seconds
         """
+        if self.game_state.state == GameState.STATE_PLAYING:
+            self._poll_movement(dt)
         self.game_state.update(dt)
 
     def render(self):
         """Render the game."""
-        self.screen.fill(COLOR_BACKGROUND)
-        
-        if self.game_state.state == GameState.STATE_START:
-            self._render_start_screen()
-        elif self.game_state.state == GameState.STATE_PLAYING:
+        state = self.game_state.state
+        if state == GameState.STATE_PLAYING:
+            self._game_over_snapshot = None
+            self._static_screen_state = None
             self._render_game()
-        elif self.game_state.state == GameState.STATE_GAME_OVER:
+            pygame.display.flip()
+            return
+
+        # The start and game-over screens are static: draw and present them
+        # once, then skip all redraw work until the state changes
+        if state == self._static_screen_state:
+            return
+
+        if state == GameState.STATE_START:
+            self._game_over_snapshot = None
+            self.screen.fill(COLOR_BACKGROUND)
+            self._render_start_screen()
+        elif state == GameState.STATE_GAME_OVER:
             self._render_game_over()
-        
+
         pygame.display.flip()
+        self._static_screen_state = state
 
     def _render_start_screen(self):
-        """Render the start screen."""
-        title = self.font.render("CROSSY ROAD CLONE", True, COLOR_TEXT)
-        title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3))
-        self.screen.blit(title, title_rect)
-        
-        instructions = [
-            "Use ARROW KEYS to move",
-            "Avoid cars, ride logs across rivers",
-            "Trees block your path on grass",
-            "Watch for trains on tracks - they're fast!",
-            "Screen auto-scrolls - don't fall behind!",
-            "Press D to toggle debug hitboxes",
-            "",
-            "Press SPACE to start"
-        ]
-        
+        """Render the start screen from pre-rendered text surfaces."""
+        title_rect = self._start_title.get_rect(
+            center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3)
+        )
+        self.screen.blit(self._start_title, title_rect)
+
         y_offset = WINDOW_HEIGHT // 2
-        for instruction in instructions:
-            text = self.small_font.render(instruction, True, COLOR_TEXT)
+        for text in self._start_instructions:
             text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, y_offset))
             self.screen.blit(text, text_rect)
             y_offset += 30
-        
-        # High score
-        high_score_text = self.small_font.render(
-            f"High Score: {self.game_state.high_score}",
-            True, COLOR_TEXT
-        )
+
+        # High score (re-rendered only when the value changes)
+        high_score = self.game_state.high_score
+        if high_score != self._high_score_cache[0]:
+            self._high_score_cache = (
+                high_score,
+                self.small_font.render(
+                    f"High Score: {high_score}", True, COLOR_TEXT
+                )
+            )
+        high_score_text = self._high_score_cache[1]
         hs_rect = high_score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
         self.screen.blit(high_score_text, hs_rect)
 
     def _render_game(self):
         """Render the game world."""
+        # Hoist hot values to locals; attribute and global lookups add up
+        # when repeated per row/obstacle at 60 Hz
+        screen = self.screen
+        cell_size = CELL_SIZE
+        game_state = self.game_state
+        terrain_manager = game_state.terrain_manager
+        obstacle_manager = game_state.obstacle_manager
+        row_surfaces = self._row_surfaces
+
         # Calculate offset to center the grid
-        offset_x = (WINDOW_WIDTH - GRID_WIDTH * CELL_SIZE) // 2
-        offset_y = (WINDOW_HEIGHT - GRID_HEIGHT * CELL_SIZE) // 2
-        
+        offset_x = (WINDOW_WIDTH - GRID_WIDTH * cell_size) // 2
+        offset_y = (WINDOW_HEIGHT - GRID_HEIGHT * cell_size) // 2
+
         # Calculate which rows to render based on scroll position
-        scroll_y = self.game_state.scroll_y
-        # Render one extra row at top and bottom to handle fractional scroll positions
-        camera_start_row = int(scroll_y)
+        scroll_y = game_state.scroll_y
+        # Render one extra row at top and bottom to handle fractional scroll positions.
+        # floor, not int: a negative fractional scroll_y must yield a start row
+        # below 0 so the clamp (and its background fill) still triggers
+        camera_start_row = floor(scroll_y)
         camera_end_row = camera_start_row + GRID_HEIGHT + 1  # +1 for partial row at bottom
-        
-        # Clamp to valid range
-        camera_start_row = max(0, camera_start_row)
-        camera_end_row = min(len(self.game_state.terrain_manager.rows), camera_end_row)
-        
-        # Render terrain (with smooth scrolling)
-        scroll_y = self.game_state.scroll_y
+
+        # Clamp to valid range; the terrain strips span the full window,
+        # so the background fill is only needed when the camera runs past
+        # the generated rows (past the top of the world or below the last row)
+        clamped = False
+        if camera_start_row < 0:
+            camera_start_row = 0
+            clamped = True
+        if camera_end_row > terrain_manager.num_rows:
+            camera_end_row = terrain_manager.num_rows
+            clamped = True
+        if clamped:
+            screen.fill(COLOR_BACKGROUND)
+
+        # Row -> screen-y table computed once and shared by the terrain,
+        # obstacle, and tree passes
+        row_screen_y = [
+            offset_y + (i - scroll_y) * cell_size
+            for i in range(camera_start_row, camera_end_row)
+        ]
+
+        # Render terrain (with smooth scrolling), batched into one blits call
+        terrain_types = terrain_manager.terrain_types
+        terrain_blits = []
         for i in range(camera_start_row, camera_end_row):
-            row = self.game_state.terrain_manager.rows[i]
-            screen_y = (i - scroll_y) * CELL_SIZE
-            
-            color = COLOR_GRASS
-            if row.terrain_type == TERRAIN_ROAD:
-                color = COLOR_ROAD
-            elif row.terrain_type == TERRAIN_RIVER:
-                color = COLOR_RIVER
-            elif row.terrain_type == TERRAIN_TRAIN:
-                color = COLOR_TRAIN_TRACK
-            
-            rect = pygame.Rect(
-                offset_x,
-                offset_y + screen_y,
-                GRID_WIDTH * CELL_SIZE,
-                CELL_SIZE
-            )
-            pygame.draw.rect(self.screen, color, rect)
-            
-            # Draw train track rails if this is a train row
-            if row.terrain_type == TERRAIN_TRAIN:
-                rail_color = (100, 80, 60)  # Slightly lighter brown for rails
-                rail_y1 = offset_y + screen_y + CELL_SIZE // 3
-                rail_y2 = offset_y + screen_y + 2 * CELL_SIZE // 3
-                rail_height = 3
-                
-                # Two horizontal rails
-                pygame.draw.rect(
-                    self.screen, 
-                    rail_color,
-                    pygame.Rect(offset_x, rail_y1, GRID_WIDTH * CELL_SIZE, rail_height)
-                )
-                pygame.draw.rect(
-                    self.screen,
-                    rail_color,
-                    pygame.Rect(offset_x, rail_y2, GRID_WIDTH * CELL_SIZE, rail_height)
-                )
-                
+            terrain_type = terrain_types[i]
+            screen_y = row_screen_y[i - camera_start_row]
+
+            terrain_blits.append((row_surfaces[terrain_type], (offset_x, screen_y)))
+
+            if terrain_type == TERRAIN_TRAIN:
                 # Check if there's a train warning for this row
-                if self.game_state.obstacle_manager.is_train_warning(i):
+                if obstacle_manager.is_train_warning(i):
                     # Flash warning color
                     import time
                     if int(time.time() * 4) % 2 == 0:  # Flash at 2Hz
-                        warning_overlay = pygame.Surface((GRID_WIDTH * CELL_SIZE, CELL_SIZE))
-                        warning_overlay.set_alpha(60)
-                        warning_overlay.fill((255, 0, 0))
-                        self.screen.blit(warning_overlay, (offset_x, offset_y + screen_y))
-        
-        # Render obstacles (with smooth scrolling)
-        for obstacle in self.game_state.obstacle_manager.obstacles:
-            if camera_start_row <= obstacle.y < camera_end_row:
-                screen_y = (obstacle.y - scroll_y) * CELL_SIZE
-                rect = pygame.Rect(
-                    offset_x + int(obstacle.x * CELL_SIZE),
-                    offset_y + screen_y,
-                    int(obstacle.width * CELL_SIZE),
-                    CELL_SIZE
+                        terrain_blits.append((self._warning_overlay, (offset_x, screen_y)))
+        if terrain_blits:
+            screen.blits(terrain_blits, doreturn=0)
+
+        # Render obstacles (with smooth scrolling), batched into one blits call
+        obstacle_blits = []
+        obstacles_by_row = obstacle_manager.obstacles_by_row
+        for i in range(camera_start_row, camera_end_row):
+            screen_y = int(row_screen_y[i - camera_start_row])
+            for obstacle in obstacles_by_row.get(i, ()):
+                surface = self._get_obstacle_surface(
+                    obstacle.color, int(obstacle.width * cell_size)
                 )
-                pygame.draw.rect(self.screen, obstacle.color, rect)
-        
-        # Render trees (with smooth scrolling)
-        for tree in self.game_state.obstacle_manager.trees:
+                obstacle_blits.append(
+                    (surface, (offset_x + int(obstacle.x * cell_size), screen_y))
+                )
+        if obstacle_blits:
+            screen.blits(obstacle_blits, doreturn=0)
+
+        # Render trees (with smooth scrolling), batched into one blits call
+        tree_blits = []
+        tree_surface = self._tree_surface
+        for tree in obstacle_manager.trees:
             if camera_start_row <= tree.y < camera_end_row:
-                screen_y = (tree.y - scroll_y) * CELL_SIZE
-                rect = pygame.Rect(
-                    offset_x + tree.x * CELL_SIZE,
-                    offset_y + screen_y,
-                    CELL_SIZE,
-                    CELL_SIZE
+                screen_y = int(row_screen_y[tree.y - camera_start_row])
+                tree_blits.append(
+                    (tree_surface, (offset_x + tree.x * cell_size, screen_y))
                 )
-                
-                # Draw tree as a circle for better visual
-                center_x = rect.centerx
-                center_y = rect.centery
-                radius = CELL_SIZE // 3
-                pygame.draw.circle(self.screen, tree.color, (center_x, center_y), radius)
-        
+        if tree_blits:
+            screen.blits(tree_blits, doreturn=0)
+
         # Render player (with smooth scrolling)
-        scroll_y = self.game_state.scroll_y
-        screen_y = (self.game_state.player.y - scroll_y) * CELL_SIZE
-        player_rect = pygame.Rect(
-            offset_x + self.game_state.player.x * CELL_SIZE,
-            offset_y + screen_y,
-            CELL_SIZE,
-            CELL_SIZE
+        player = game_state.player
+        screen_y = (player.y - scroll_y) * cell_size
+        pygame.draw.rect(
+            screen, COLOR_PLAYER,
+            (offset_x + player.x * cell_size, offset_y + screen_y,
+             cell_size, cell_size)
         )
-        pygame.draw.rect(self.screen, COLOR_PLAYER, player_rect)
         
         # Debug mode: render hitboxes
         if self.debug_mode:
             self._render_debug_hitboxes(offset_x, offset_y, camera_start_row, camera_end_row)
         
-        # Render score
-        score_text = self.font.render(
-            f"Score: {self.game_state.get_score()}",
-            True, COLOR_TEXT
-        )
-        self.screen.blit(score_text, (10, 10))
+        # Render score (font rasterization is slow, so cache until it changes)
+        score = game_state.get_score()
+        if score != self._score_cache[0]:
+            self._score_cache = (
+                score,
+                self.font.render(f"Score: {score}", True, COLOR_TEXT)
+            )
+        screen.blit(self._score_cache[1], (10, 10))
         
         # Debug mode indicator
         if self.debug_mode:
-            debug_text = self.small_font.render("DEBUG MODE", True, DEBUG_HITBOX_COLOR)
-            self.screen.blit(debug_text, (10, 50))
+            screen.blit(self._debug_label, (10, 50))
 
     def _render_debug_hitboxes(self, offset_x, offset_y, camera_start_row, camera_end_row):
         """
@@ -266,12 +437,13 @@ class Game:
             )
             pygame.draw.rect(self.screen, DEBUG_HITBOX_COLOR, hitbox_rect, 2)
         
-        # Draw obstacle hitboxes
-        for obstacle in self.game_state.obstacle_manager.obstacles:
-            if camera_start_row <= obstacle.y < camera_end_row:
+        # Draw obstacle hitboxes (only visible rows, via the row index)
+        obstacles_by_row = self.game_state.obstacle_manager.obstacles_by_row
+        for i in range(camera_start_row, camera_end_row):
+            for obstacle in obstacles_by_row.get(i, ()):
                 left, top, right, bottom = obstacle.get_collision_box()
                 screen_y = (top - scroll_y) * CELL_SIZE
-                
+
                 hitbox_rect = pygame.Rect(
                     offset_x + left * CELL_SIZE,
                     offset_y + screen_y,
@@ -295,51 +467,75 @@ class Game:
 
     def _render_game_over(self):
         """Render the game over screen."""
-        # Render the game state in background (dimmed)
-        self._render_game()
+        # The scene is frozen once game over fires: render it one last time,
+        # snapshot it, and reuse the snapshot on subsequent frames
+        if self._game_over_snapshot is None:
+            self._render_game()
+            self._game_over_snapshot = self.screen.copy()
+        else:
+            self.screen.blit(self._game_over_snapshot, (0, 0))
         
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._game_over_overlay, (0, 0))
         
         # Game over text
-        game_over = self.font.render("GAME OVER", True, COLOR_TEXT)
-        go_rect = game_over.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3))
-        self.screen.blit(game_over, go_rect)
-        
-        # Score
+        go_rect = self._game_over_title.get_rect(
+            center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3)
+        )
+        self.screen.blit(self._game_over_title, go_rect)
+
+        # Score (shares the cache with the in-game score display)
         score = self.game_state.get_score()
-        score_text = self.font.render(f"Score: {score}", True, COLOR_TEXT)
+        if score != self._score_cache[0]:
+            self._score_cache = (
+                score,
+                self.font.render(f"Score: {score}", True, COLOR_TEXT)
+            )
+        score_text = self._score_cache[1]
         score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
         self.screen.blit(score_text, score_rect)
-        
+
         # High score
-        if score >= self.game_state.high_score:
-            hs_text = self.font.render("NEW HIGH SCORE!", True, (255, 215, 0))
+        high_score = self.game_state.high_score
+        if score >= high_score:
+            hs_text = self._new_high_score_text
         else:
-            hs_text = self.small_font.render(
-                f"High Score: {self.game_state.high_score}",
-                True, COLOR_TEXT
-            )
+            if high_score != self._high_score_cache[0]:
+                self._high_score_cache = (
+                    high_score,
+                    self.small_font.render(
+                        f"High Score: {high_score}", True, COLOR_TEXT
+                    )
+                )
+            hs_text = self._high_score_cache[1]
         hs_rect = hs_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
         self.screen.blit(hs_text, hs_rect)
-        
+
         # Restart prompt
-        restart_text = self.small_font.render("Press R to restart", True, COLOR_TEXT)
-        restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 100))
-        self.screen.blit(restart_text, restart_rect)
+        restart_rect = self._restart_prompt.get_rect(
+            center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 100)
+        )
+        self.screen.blit(self._restart_prompt, restart_rect)
 
     def run(self):
         """Run the game loop."""
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
-            
-            self.handle_events()
-            self.update(dt)
-            self.render()
-        
+            if self.game_state.state == GameState.STATE_PLAYING:
+                dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+
+                self.handle_events()
+                self.update(dt)
+                self.render()
+            else:
+                # Start and game-over screens don't animate: draw once,
+                # then sleep in event.wait instead of spinning at FPS.
+                # The timeout keeps the loop responsive to self.running
+                self.render()
+                event = pygame.event.wait(100)
+                if event.type != pygame.NOEVENT:
+                    self._dispatch_event(event)
+                self.clock.tick()  # Reset the dt baseline for resuming play
+
         pygame.quit()
 
 
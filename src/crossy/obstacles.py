@@ -1,36 +1,48 @@
 """Obstacles (cars and logs) logic."""
 
 import random
+from collections import defaultdict
+from math import floor
 from crossy.config import (
     GRID_WIDTH, CAR_SPEED_MIN, CAR_SPEED_MAX,
     LOG_SPEED_MIN, LOG_SPEED_MAX,
     CARS_PER_ROW, LOGS_PER_ROW, TREES_PER_ROW,
-    COLOR_CAR_RED, COLOR_CAR_BLUE, COLOR_CAR_ORANGE, COLOR_TREE,
+    COLOR_CAR_RED, COLOR_CAR_BLUE, COLOR_CAR_ORANGE, COLOR_TREE, COLOR_LOG,
+    TERRAIN_GRASS, TERRAIN_ROAD, TERRAIN_RIVER, TERRAIN_TRAIN,
     TRAIN_SPEED, TRAIN_WIDTH, TRAIN_SPAWN_INTERVAL_MIN, TRAIN_SPAWN_INTERVAL_MAX,
     TRAIN_WARNING_TIME, COLOR_TRAIN, TOTAL_ROWS
 )
 
 
+# Bottom 5 rows are safe zone; reciprocal hoisted so get_progress multiplies
+_PLAYABLE_ROWS = TOTAL_ROWS - 5
+_INV_PLAYABLE = 1.0 / _PLAYABLE_ROWS
+
+
 def get_progress(row_y):
     """
     Calculate progress based on row number.
-    
+
     Progress goes from 0.0 (start, high row numbers) to 1.0 (furthest point, row 0).
-    
+
     Args:
         row_y: Row Y coordinate
-    
+
     Returns:
         float: Progress value between 0.0 and 1.0
     """
-    playable_rows = TOTAL_ROWS - 5  # Bottom 5 rows are safe zone
-    progress = 1.0 - (row_y / playable_rows)
-    return max(0.0, min(1.0, progress))
+    progress = 1.0 - row_y * _INV_PLAYABLE
+    if progress < 0.0:
+        return 0.0
+    return progress if progress < 1.0 else 1.0
 
 
 class Obstacle:
     """Base class for moving obstacles."""
 
+    __slots__ = ('x', 'y', 'speed', 'direction', 'velocity', 'width', 'color',
+                 'wrap_span', 'right')
+
     def __init__(self, x, y, speed, direction, width=1, color=None):
         """
         Initialize an obstacle.
@@ -47,36 +59,29 @@ class Obstacle:
         self.y = y
         self.speed = speed
         self.direction = direction
+        self.velocity = speed * direction  # Signed speed, precomputed for update
         self.width = width
         self.color = color
+        self.wrap_span = GRID_WIDTH + 2 * width  # Wrap period for update
+        self.right = x + width  # Cached right edge, refreshed in update()
 
     def update(self, dt):
         """
         Update obstacle position.
-        
+
         Args:
             dt: Delta time in seconds
         """
-        self.x += self.speed * self.direction * dt
-        
-        # Wrap around screen edges (accounting for width)
-        if self.direction > 0 and self.x > GRID_WIDTH + self.width:
-            self.x = -self.width
-        elif self.direction < 0 and self.x < -self.width:
-            self.x = GRID_WIDTH + self.width
+        # Branchless wrap: one modulo keeps x in [-width, GRID_WIDTH + width)
+        # for either direction of travel
+        self.x = (self.x + self.velocity * dt + self.width) % self.wrap_span - self.width
+        self.right = self.x + self.width
 
     def get_grid_x(self):
         """Get the grid x coordinate (rounded)."""
-        return int(round(self.x))
-    
-    def get_left_edge(self):
-        """Get the left edge of the obstacle."""
-        return self.x
-    
-    def get_right_edge(self):
-        """Get the right edge of the obstacle."""
-        return self.x + self.width
-    
+        # floor(x + 0.5) rounds to nearest without round()'s float detour
+        return floor(self.x + 0.5)
+
     def get_collision_box(self):
         """
         Get the collision box.
@@ -85,24 +90,37 @@ class Obstacle:
         return (
             self.x,
             self.y,
-            self.x + self.width,
+            self.right,
             self.y + 1
         )
 
 
+CAR_COLORS = (COLOR_CAR_RED, COLOR_CAR_BLUE, COLOR_CAR_ORANGE)
+
+# Obstacle kind tags: an int compare beats isinstance in the collision loops
+KIND_CAR = 0
+KIND_LOG = 1
+KIND_TRAIN = 2
+
+
 class Car(Obstacle):
     """Base car obstacle on roads."""
 
+    __slots__ = ()
+    kind = KIND_CAR
+
     def __init__(self, x, y, speed, direction, width=1, color=None):
         """Initialize a car with random color if not specified."""
         if color is None:
-            color = random.choice([COLOR_CAR_RED, COLOR_CAR_BLUE, COLOR_CAR_ORANGE])
+            color = random.choice(CAR_COLORS)
         super().__init__(x, y, speed, direction, width=width, color=color)
 
 
 class Truck(Car):
     """A large truck - 3 blocks wide."""
 
+    __slots__ = ()
+
     def __init__(self, x, y, speed, direction):
         """Initialize a truck."""
         super().__init__(x, y, speed, direction, width=3, color=COLOR_CAR_ORANGE)
@@ -111,6 +129,8 @@ class Truck(Car):
 class Sedan(Car):
     """A medium sedan - 2 blocks wide."""
 
+    __slots__ = ()
+
     def __init__(self, x, y, speed, direction):
         """Initialize a sedan."""
         super().__init__(x, y, speed, direction, width=2, color=COLOR_CAR_BLUE)
@@ -119,6 +139,8 @@ class Sedan(Car):
 class SmartCar(Car):
     """A small smart car - 1 block wide."""
 
+    __slots__ = ()
+
     def __init__(self, x, y, speed, direction):
         """Initialize a smart car."""
         super().__init__(x, y, speed, direction, width=1, color=COLOR_CAR_RED)
@@ -127,6 +149,9 @@ class SmartCar(Car):
 class Log(Obstacle):
     """A log obstacle on rivers that the player can ride."""
 
+    __slots__ = ()
+    kind = KIND_LOG
+
     def __init__(self, x, y, speed, direction, color, width=2.5):
         """Initialize a log with width."""
         super().__init__(x, y, speed, direction, width=width, color=color)
@@ -135,6 +160,8 @@ class Log(Obstacle):
 class Tree:
     """A static tree obstacle on grass that blocks player movement."""
 
+    __slots__ = ('x', 'y', 'color')
+
     def __init__(self, x, y):
         """
         Initialize a tree at a fixed position.
@@ -155,6 +182,9 @@ class Tree:
 class Train(Obstacle):
     """A train obstacle that covers the entire track."""
 
+    __slots__ = ()
+    kind = KIND_TRAIN
+
     def __init__(self, x, y, direction):
         """Initialize a train with direction."""
         super().__init__(x, y, TRAIN_SPEED, direction, width=TRAIN_WIDTH, color=COLOR_TRAIN)
@@ -163,17 +193,23 @@ class Train(Obstacle):
 class TrainTrack:
     """Manages train spawning for a single train track row."""
 
-    def __init__(self, row_y, progress=0.5):
+    __slots__ = ('row_y', 'progress', 'rng', 'direction', 'train',
+                 'spawn_interval_min', 'spawn_interval_max',
+                 'time_until_next_train', 'warning')
+
+    def __init__(self, row_y, progress=0.5, rng=random):
         """
         Initialize a train track with difficulty scaling.
-        
+
         Args:
             row_y: Y coordinate of this train track
             progress: Game progress (0.0 to 1.0) for difficulty scaling
+            rng: Random source (a random.Random instance, or the module)
         """
         self.row_y = row_y
         self.progress = progress
-        self.direction = random.choice([-1, 1])  # Train direction
+        self.rng = rng
+        self.direction = rng.choice([-1, 1])  # Train direction
         self.train = None  # Current active train (if any)
         
         # Scale spawn intervals with progress
@@ -190,23 +226,23 @@ class TrainTrack:
         immediate_spawn_chance = 0.10 + 0.20 * progress  # 10% -> 30%
         warning_chance = 0.10 + 0.20 * progress  # 10% -> 30%
         
-        roll = random.random()
+        roll = rng.random()
         if roll < immediate_spawn_chance:
             # Spawn train immediately at a random position on the track
             if self.direction > 0:
-                x = random.uniform(-TRAIN_WIDTH, GRID_WIDTH * 0.3)
+                x = rng.uniform(-TRAIN_WIDTH, GRID_WIDTH * 0.3)
             else:
-                x = random.uniform(GRID_WIDTH * 0.7, GRID_WIDTH + TRAIN_WIDTH)
+                x = rng.uniform(GRID_WIDTH * 0.7, GRID_WIDTH + TRAIN_WIDTH)
             self.train = Train(x, row_y, self.direction)
-            self.time_until_next_train = random.uniform(self.spawn_interval_min, self.spawn_interval_max)
+            self.time_until_next_train = rng.uniform(self.spawn_interval_min, self.spawn_interval_max)
             self.warning = False
         elif roll < immediate_spawn_chance + warning_chance:
             # Start with warning active (train coming very soon)
-            self.time_until_next_train = random.uniform(0.5, TRAIN_WARNING_TIME)
+            self.time_until_next_train = rng.uniform(0.5, TRAIN_WARNING_TIME)
             self.warning = True
         else:
             # Normal random interval
-            self.time_until_next_train = random.uniform(self.spawn_interval_min, self.spawn_interval_max)
+            self.time_until_next_train = rng.uniform(self.spawn_interval_min, self.spawn_interval_max)
             self.warning = False
 
     def update(self, dt):
@@ -225,7 +261,7 @@ class TrainTrack:
                (self.direction < 0 and self.train.x < -TRAIN_WIDTH):
                 self.train = None
                 # Schedule next train using scaled intervals
-                self.time_until_next_train = random.uniform(self.spawn_interval_min, self.spawn_interval_max)
+                self.time_until_next_train = self.rng.uniform(self.spawn_interval_min, self.spawn_interval_max)
                 self.warning = False
         
         # If no train, count down to next spawn
@@ -258,116 +294,143 @@ class TrainTrack:
 class ObstacleManager:
     """Manages all obstacles in the game."""
 
-    def __init__(self):
-        """Initialize obstacle manager."""
-        self.obstacles = []
+    def __init__(self, rng=None):
+        """
+        Initialize obstacle manager.
+
+        Args:
+            rng: Optional random.Random instance; one is created if omitted.
+                 A dedicated instance avoids the module-level indirection on
+                 every call and makes generation seedable for reproducibility.
+        """
+        self.rng = rng if rng is not None else random.Random()
+        self.obstacles_by_row = defaultdict(list)  # Maps row_y to obstacles on it
         self.trees = []
+        self.trees_by_row = {}  # Maps row_y to a frozenset of tree x positions
         self.train_tracks = {}  # Maps row_y to TrainTrack object
 
+    def _add_obstacle(self, obstacle):
+        """Add an obstacle to the row index."""
+        self.obstacles_by_row[obstacle.y].append(obstacle)
+
     def generate_for_row(self, row_y, terrain_type):
         """
         Generate obstacles for a specific row with difficulty scaling.
-        
+
         Obstacle density and speed scale with progress:
         - Early game: fewer, slower obstacles
         - Late game: more, faster obstacles
-        
+
         Args:
             row_y: Y coordinate of the row
             terrain_type: Type of terrain for this row
         """
-        from crossy.config import TERRAIN_ROAD, TERRAIN_RIVER, TERRAIN_GRASS, TERRAIN_TRAIN, COLOR_LOG
-        
         # Remove old obstacles for this row
-        self.obstacles = [obs for obs in self.obstacles if obs.y != row_y]
+        self.obstacles_by_row.pop(row_y, None)
         self.trees = [tree for tree in self.trees if tree.y != row_y]
-        
+        self.trees_by_row.pop(row_y, None)
+
         # Remove old train track for this row if it exists
         if row_y in self.train_tracks:
             del self.train_tracks[row_y]
-        
+
         # Get progress for difficulty scaling
         progress = get_progress(row_y)
-        
-        if terrain_type == TERRAIN_ROAD:
-            # Scale car count with progress
-            # Early: 1-2 cars, Late: 2-5 cars
-            min_cars = 1 + int(progress * 1)  # 1 -> 2
-            max_cars = 2 + int(progress * 3)  # 2 -> 5
-            num_cars = random.randint(min_cars, max_cars)
-            
-            # Scale speed with progress
-            # Early: slower cars (0.8-1.5), Late: faster (1.0-3.0)
-            speed_min = CAR_SPEED_MIN * (0.8 + 0.2 * progress)
-            speed_max = CAR_SPEED_MIN + (CAR_SPEED_MAX - CAR_SPEED_MIN) * (0.5 + 0.5 * progress)
-            speed = random.uniform(speed_min, speed_max)
-            direction = random.choice([-1, 1])
-            
-            for i in range(num_cars):
-                # Space cars evenly with some randomness
-                spacing = GRID_WIDTH / num_cars
-                x = i * spacing + random.uniform(-spacing * 0.3, spacing * 0.3)
-                if direction < 0:
-                    x = GRID_WIDTH - x
-                
-                # Randomly choose car type (more trucks at higher progress)
-                truck_weight = 0.1 + 0.2 * progress  # 0.1 -> 0.3
-                sedan_weight = 0.4
-                smart_weight = 0.5 - 0.1 * progress  # 0.5 -> 0.4
-                
-                car_type = random.choices(
-                    [SmartCar, Sedan, Truck],
-                    weights=[smart_weight, sedan_weight, truck_weight],
-                    k=1
-                )[0]
-                car = car_type(x, row_y, speed, direction)
-                self.obstacles.append(car)
-        
-        elif terrain_type == TERRAIN_RIVER:
-            # Scale log count inversely with progress (fewer logs = harder)
-            # Early: 3-4 logs (easier), Late: 2-3 logs (harder)
-            min_logs = max(2, 3 - int(progress * 1))  # 3 -> 2
-            max_logs = max(3, 4 - int(progress * 1))  # 4 -> 3
-            num_logs = random.randint(min_logs, max_logs)
-            
-            # Scale speed with progress (faster = harder)
-            speed_min = LOG_SPEED_MIN * (0.8 + 0.4 * progress)
-            speed_max = LOG_SPEED_MIN + (LOG_SPEED_MAX - LOG_SPEED_MIN) * (0.6 + 0.4 * progress)
-            speed = random.uniform(speed_min, speed_max)
-            direction = random.choice([-1, 1])
-            
-            for i in range(num_logs):
-                # Space logs evenly
-                spacing = GRID_WIDTH / num_logs
-                x = i * spacing + random.uniform(-spacing * 0.2, spacing * 0.2)
-                if direction < 0:
-                    x = GRID_WIDTH - x
-                
-                log = Log(x, row_y, speed, direction, COLOR_LOG)
-                self.obstacles.append(log)
-        
-        elif terrain_type == TERRAIN_GRASS:
-            # Scale tree count with progress (more trees = harder navigation)
-            # Early: 0-2 trees, Late: 0-4 trees
-            min_trees = 0
-            max_trees = 2 + int(progress * 2)  # 2 -> 4
-            num_trees = random.randint(min_trees, max_trees)
-            
-            if num_trees > 0:
-                # Generate random positions for trees (avoid duplicates)
-                positions = random.sample(range(GRID_WIDTH), num_trees)
-                for x in positions:
-                    tree = Tree(x, row_y)
-                    self.trees.append(tree)
-        
-        elif terrain_type == TERRAIN_TRAIN:
-            # Create a train track for this row
-            train_track = TrainTrack(row_y, progress)
-            self.train_tracks[row_y] = train_track
-            
-            # If the train track already has a train, add it to obstacles
-            if train_track.train is not None:
-                self.obstacles.append(train_track.train)
+
+        self._ROW_GENERATORS[terrain_type](self, row_y, progress)
+
+    def _generate_road_row(self, row_y, progress):
+        """Generate cars for a road row."""
+        # Scale car count with progress
+        # Early: 1-2 cars, Late: 2-5 cars
+        min_cars = 1 + int(progress * 1)  # 1 -> 2
+        max_cars = 2 + int(progress * 3)  # 2 -> 5
+        num_cars = self.rng.randint(min_cars, max_cars)
+
+        # Scale speed with progress
+        # Early: slower cars (0.8-1.5), Late: faster (1.0-3.0)
+        speed_min = CAR_SPEED_MIN * (0.8 + 0.2 * progress)
+        speed_max = CAR_SPEED_MIN + (CAR_SPEED_MAX - CAR_SPEED_MIN) * (0.5 + 0.5 * progress)
+        speed = self.rng.uniform(speed_min, speed_max)
+        direction = self.rng.choice([-1, 1])
+
+        for i in range(num_cars):
+            # Space cars evenly with some randomness
+            spacing = GRID_WIDTH / num_cars
+            x = i * spacing + self.rng.uniform(-spacing * 0.3, spacing * 0.3)
+            if direction < 0:
+                x = GRID_WIDTH - x
+
+            # Randomly choose car type (more trucks at higher progress)
+            truck_weight = 0.1 + 0.2 * progress  # 0.1 -> 0.3
+            sedan_weight = 0.4
+            smart_weight = 0.5 - 0.1 * progress  # 0.5 -> 0.4
+
+            car_type = self.rng.choices(
+                [SmartCar, Sedan, Truck],
+                weights=[smart_weight, sedan_weight, truck_weight],
+                k=1
+            )[0]
+            car = car_type(x, row_y, speed, direction)
+            self._add_obstacle(car)
+
+    def _generate_river_row(self, row_y, progress):
+        """Generate logs for a river row."""
+        # Scale log count inversely with progress (fewer logs = harder)
+        # Early: 3-4 logs (easier), Late: 2-3 logs (harder)
+        min_logs = max(2, 3 - int(progress * 1))  # 3 -> 2
+        max_logs = max(3, 4 - int(progress * 1))  # 4 -> 3
+        num_logs = self.rng.randint(min_logs, max_logs)
+
+        # Scale speed with progress (faster = harder)
+        speed_min = LOG_SPEED_MIN * (0.8 + 0.4 * progress)
+        speed_max = LOG_SPEED_MIN + (LOG_SPEED_MAX - LOG_SPEED_MIN) * (0.6 + 0.4 * progress)
+        speed = self.rng.uniform(speed_min, speed_max)
+        direction = self.rng.choice([-1, 1])
+
+        for i in range(num_logs):
+            # Space logs evenly
+            spacing = GRID_WIDTH / num_logs
+            x = i * spacing + self.rng.uniform(-spacing * 0.2, spacing * 0.2)
+            if direction < 0:
+                x = GRID_WIDTH - x
+
+            log = Log(x, row_y, speed, direction, COLOR_LOG)
+            self._add_obstacle(log)
+
+    def _generate_grass_row(self, row_y, progress):
+        """Generate trees for a grass row."""
+        # Scale tree count with progress (more trees = harder navigation)
+        # Early: 0-2 trees, Late: 0-4 trees
+        min_trees = 0
+        max_trees = 2 + int(progress * 2)  # 2 -> 4
+        num_trees = self.rng.randint(min_trees, max_trees)
+
+        if num_trees > 0:
+            # Generate random positions for trees (avoid duplicates)
+            positions = self.rng.sample(range(GRID_WIDTH), num_trees)
+            for x in positions:
+                tree = Tree(x, row_y)
+                self.trees.append(tree)
+            self.trees_by_row[row_y] = frozenset(positions)
+
+    def _generate_train_row(self, row_y, progress):
+        """Create a train track for a train row."""
+        train_track = TrainTrack(row_y, progress, self.rng)
+        self.train_tracks[row_y] = train_track
+
+        # If the train track already has a train, add it to obstacles
+        if train_track.train is not None:
+            self._add_obstacle(train_track.train)
+
+    # Terrain type -> row generator; a hashed dispatch replacing the
+    # if/elif chain over terrain constants
+    _ROW_GENERATORS = {
+        TERRAIN_ROAD: _generate_road_row,
+        TERRAIN_RIVER: _generate_river_row,
+        TERRAIN_GRASS: _generate_grass_row,
+        TERRAIN_TRAIN: _generate_train_row,
+    }
 
     def update(self, dt):
         """
@@ -376,14 +439,16 @@ class ObstacleManager:
         Args:
             dt: Delta time in seconds
         """
-        for obstacle in self.obstacles:
-            obstacle.update(dt)
+        for row_obstacles in self.obstacles_by_row.values():
+            for obstacle in row_obstacles:
+                obstacle.update(dt)
         
-        # Update train tracks and spawn trains
-        for train_track in list(self.train_tracks.values()):
+        # Update train tracks and spawn trains (nothing mutates the dict
+        # inside the loop, so no defensive copy is needed)
+        for train_track in self.train_tracks.values():
             new_train = train_track.update(dt)
             if new_train is not None:
-                self.obstacles.append(new_train)
+                self._add_obstacle(new_train)
 
     def get_obstacles_at(self, grid_y):
         """
@@ -395,7 +460,7 @@ class ObstacleManager:
         Returns:
             list: List of obstacles at this row
         """
-        return [obs for obs in self.obstacles if obs.y == grid_y]
+        return self.obstacles_by_row.get(grid_y, [])
 
     def check_collision_with_car(self, player_x, player_y):
         """
@@ -411,16 +476,12 @@ class ObstacleManager:
         # Player occupies 1 cell width
         player_left = player_x
         player_right = player_x + 1
-        
-        for obstacle in self.obstacles:
-            if isinstance(obstacle, Car) and obstacle.y == player_y:
-                car_left = obstacle.get_left_edge()
-                car_right = obstacle.get_right_edge()
-                
-                # Check for overlap
-                if player_left < car_right and player_right > car_left:
-                    return True
-        return False
+
+        return any(
+            player_left < obstacle.right and player_right > obstacle.x
+            for obstacle in self.obstacles_by_row.get(player_y, ())
+            if obstacle.kind == KIND_CAR
+        )
 
     def check_collision_with_train(self, player_x, player_y):
         """
@@ -436,16 +497,12 @@ class ObstacleManager:
         # Player occupies 1 cell width
         player_left = player_x
         player_right = player_x + 1
-        
-        for obstacle in self.obstacles:
-            if isinstance(obstacle, Train) and obstacle.y == player_y:
-                train_left = obstacle.get_left_edge()
-                train_right = obstacle.get_right_edge()
-                
-                # Check for overlap
-                if player_left < train_right and player_right > train_left:
-                    return True
-        return False
+
+        return any(
+            player_left < obstacle.right and player_right > obstacle.x
+            for obstacle in self.obstacles_by_row.get(player_y, ())
+            if obstacle.kind == KIND_TRAIN
+        )
 
     def is_train_warning(self, grid_y):
         """
@@ -476,21 +533,17 @@ class ObstacleManager:
         # Player occupies 1 cell width
         player_left = player_x
         player_right = player_x + 1
-        player_width = 1.0
-        
-        for obstacle in self.obstacles:
-            if isinstance(obstacle, Log) and obstacle.y == player_y:
-                log_left = obstacle.get_left_edge()
-                log_right = obstacle.get_right_edge()
-                
-                # Calculate overlap
-                overlap_left = max(player_left, log_left)
-                overlap_right = min(player_right, log_right)
-                overlap = max(0, overlap_right - overlap_left)
-                
-                # If at least 25% of player is on the log, they're safe
-                # (slightly more forgiving to account for floating point precision)
-                if overlap >= player_width * 0.25:
+
+        for obstacle in self.obstacles_by_row.get(player_y, ()):
+            if obstacle.kind == KIND_LOG:
+                # Clip the player span against the log span; conditional
+                # expressions avoid three max/min builtin calls per log
+                left = obstacle.x if obstacle.x > player_left else player_left
+                right = obstacle.right if obstacle.right < player_right else player_right
+
+                # If at least 25% of the 1-cell player is on the log, they're
+                # safe (slightly forgiving for floating point precision)
+                if right - left >= 0.25:
                     return obstacle
         return None
 
@@ -505,15 +558,14 @@ class ObstacleManager:
         Returns:
             bool: True if there's a tree at this position
         """
-        for tree in self.trees:
-            if tree.x == grid_x and tree.y == grid_y:
-                return True
-        return False
+        row_trees = self.trees_by_row.get(grid_y)
+        return row_trees is not None and grid_x in row_trees
 
     def clear(self):
         """Clear all obstacles."""
-        self.obstacles.clear()
+        self.obstacles_by_row.clear()
         self.trees.clear()
+        self.trees_by_row.clear()
         self.train_tracks.clear()
 
     def reset(self):
@@ -6,6 +6,8 @@ from crossy.config import PLAYER_START_X, PLAYER_START_Y
 class Player:
     """Represents the player character."""
 
+    __slots__ = ('x', 'y', 'max_row')
+
     def __init__(self):
         """Initialize the player at starting position."""
         self.x = float(PLAYER_START_X)  # Float to allow smooth log movement
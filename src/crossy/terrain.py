@@ -1,35 +1,140 @@
 """Terrain generation and management."""
 
+import os
 import random
+import threading
+from bisect import bisect
+from queue import Empty, Queue
 from crossy.config import (
     TERRAIN_GRASS, TERRAIN_ROAD, TERRAIN_RIVER, TERRAIN_TRAIN,
     GRID_WIDTH, TOTAL_ROWS
 )
 
 
-class TerrainRow:
-    """Represents a single row of terrain."""
+# Order in which cumulative terrain probabilities are laid out
+_TERRAIN_ORDER = (TERRAIN_GRASS, TERRAIN_ROAD, TERRAIN_RIVER, TERRAIN_TRAIN)
 
-    def __init__(self, row_num, terrain_type):
-        """
-        Initialize a terrain row.
-        
-        Args:
-            row_num: Y coordinate of this row
-            terrain_type: Type of terrain (grass, road, river)
-        """
-        self.row_num = row_num
-        self.terrain_type = terrain_type
+# Bottom 5 rows are safe zone; reciprocal hoisted so _get_progress multiplies
+_PLAYABLE_ROWS = TOTAL_ROWS - 5
+_INV_PLAYABLE = 1.0 / _PLAYABLE_ROWS
+
+# Cluster-size (lo, hi) ranges indexed [terrain_code][progress_bucket],
+# with buckets progress < 0.3, < 0.6, and above. Dangerous terrain clusters
+# grow with difficulty but stay conservative; trains are always single rows
+_CLUSTER_RANGES = (
+    ((1, 2), (1, 2), (1, 2)),  # grass
+    ((1, 1), (1, 2), (1, 3)),  # road
+    ((1, 1), (1, 2), (1, 3)),  # river
+    ((1, 1), (1, 1), (1, 1)),  # train
+)
+
+# Pregenerated terrains kept ready so reset() is a swap, not a rebuild
+_TERRAIN_POOL_SIZE = 2
+
+# On-disk cache for seeded terrains, so replaying a seed skips generation
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'crossy-road')
 
 
 class TerrainManager:
     """Manages terrain generation."""
 
-    def __init__(self):
-        """Initialize terrain manager with a large static grid."""
-        self.rows = []
+    def __init__(self, seed=None):
+        """
+        Initialize terrain manager with a large static grid.
+
+        Args:
+            seed: Optional seed for deterministic terrain; seeded layouts
+                  are cached on disk and reused when the seed is replayed
+        """
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # One byte per row: terrain codes are small ints (see config.Terrain)
+        self.terrain_types = bytearray(TOTAL_ROWS)
+        self.num_rows = TOTAL_ROWS
+        # Progress is a pure function of the row number; evaluate it once
+        self._progress = tuple(self._get_progress(r) for r in range(TOTAL_ROWS))
+        self._cum_probs = self._build_probability_table()
+
+        if seed is not None:
+            # A seeded terrain is stable across resets, so there is no
+            # refill pool; load it from the cache or generate-and-cache it
+            if not self._load_cached_terrain():
+                self._generate_terrain()
+                self._save_cached_terrain()
+            return
+
         self._generate_terrain()
 
+        # A daemon thread keeps a small pool of replacement terrains ready;
+        # Queue.put blocks while the pool is full, so the thread idles
+        # between resets
+        self._pool = Queue(maxsize=_TERRAIN_POOL_SIZE)
+        threading.Thread(target=self._prefill_pool, daemon=True).start()
+
+    def _cache_path(self):
+        """Path of the on-disk terrain cache entry for this seed."""
+        return os.path.join(_CACHE_DIR, f'terrain-{self.seed}.bin')
+
+    def _load_cached_terrain(self):
+        """
+        Load this seed's cached terrain, if present.
+
+        Returns:
+            bool: True if the cache entry existed and was valid
+        """
+        try:
+            with open(self._cache_path(), 'rb') as f:
+                data = f.read(TOTAL_ROWS)
+        except (FileNotFoundError, IOError):
+            return False
+        # A truncated or corrupted entry (bytes outside the terrain codes)
+        # is treated as missing so startup falls back to regeneration
+        if len(data) != TOTAL_ROWS or max(data) >= len(_TERRAIN_ORDER):
+            return False
+        self.terrain_types[:] = data
+        return True
+
+    def _save_cached_terrain(self):
+        """Write this seed's terrain to the on-disk cache."""
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            with open(self._cache_path(), 'wb') as f:
+                f.write(self.terrain_types)
+        except IOError:
+            pass
+
+    def _prefill_pool(self):
+        """Keep the reset pool topped up with pregenerated terrains."""
+        while True:
+            terrain_types = bytearray(TOTAL_ROWS)
+            self._generate_into(terrain_types)
+            self._pool.put(terrain_types)
+
+    def _build_probability_table(self):
+        """
+        Precompute cumulative terrain probabilities for every row.
+
+        The probability formula depends only on the row number, so it is
+        evaluated once here instead of once per row on every reset.
+
+        Returns:
+            tuple: Per-row tuples of cumulative probabilities in
+                   _TERRAIN_ORDER order
+        """
+        table = []
+        for row_num in range(TOTAL_ROWS):
+            probabilities = self._get_terrain_probabilities(self._progress[row_num])
+            cumulative = []
+            total = 0.0
+            for terrain_type in _TERRAIN_ORDER:
+                total += probabilities[terrain_type]
+                cumulative.append(total)
+            # Pin the last bound to 1.0 so float accumulation error can
+            # never push a roll past the end of the table
+            cumulative[-1] = 1.0
+            table.append(tuple(cumulative))
+        return tuple(table)
+
     def _get_progress(self, row_num):
         """
         Calculate progress based on row number.
@@ -40,9 +145,10 @@ class TerrainManager:
         Returns:
             float: Progress from 0.0 (start) to 1.0 (furthest point)
         """
-        playable_rows = TOTAL_ROWS - 5
-        progress = 1.0 - (row_num / playable_rows)
-        return max(0.0, min(1.0, progress))
+        progress = 1.0 - row_num * _INV_PLAYABLE
+        if progress < 0.0:
+            return 0.0
+        return progress if progress < 1.0 else 1.0
 
     def _get_terrain_probabilities(self, progress):
         """
@@ -86,130 +192,112 @@ class TerrainManager:
             TERRAIN_TRAIN: train_prob
         }
 
-    def _pick_terrain_type(self, probabilities):
+    def _pick_terrain_type(self, row_num):
         """
-        Pick a terrain type based on probabilities.
-        
+        Pick a terrain type using the precomputed cumulative table.
+
         Args:
-            probabilities: Dict mapping terrain type to probability
-        
+            row_num: The row number being generated
+
         Returns:
-            str: Selected terrain type
+            Terrain: Selected terrain type
         """
-        roll = random.random()
-        cumulative = 0.0
-        
-        for terrain_type, prob in probabilities.items():
-            cumulative += prob
-            if roll < cumulative:
-                return terrain_type
-        
-        # Fallback (shouldn't happen if probabilities sum to 1)
-        return TERRAIN_GRASS
+        # Binary search over the cumulative bounds instead of a branch chain;
+        # the last bound is pinned to 1.0 so the index is always in range
+        return _TERRAIN_ORDER[bisect(self._cum_probs[row_num], self.rng.random())]
 
     def _get_cluster_size(self, terrain_type, progress):
         """
         Get cluster size for a terrain type based on progress.
-        
-        Dangerous terrain clusters get larger as difficulty increases,
-        but stay conservative to avoid overwhelming the player.
-        
+
+        Looks up the (lo, hi) row-count range in the _CLUSTER_RANGES table.
+
         Args:
             terrain_type: The type of terrain
             progress: Game progress from 0.0 to 1.0
-        
+
         Returns:
             int: Number of rows in this cluster
         """
-        if terrain_type == TERRAIN_GRASS:
-            # Grass clusters: 1-2 rows consistently
-            return random.randint(1, 2)
-        
-        elif terrain_type == TERRAIN_ROAD:
-            # Road clusters: very conservative scaling
-            # Early (progress < 0.3): always 1 row
-            # Mid (0.3-0.6): 1-2 rows
-            # Late (> 0.6): 1-3 rows
-            if progress < 0.3:
-                return 1
-            elif progress < 0.6:
-                return random.randint(1, 2)
-            else:
-                return random.randint(1, 3)
-        
-        elif terrain_type == TERRAIN_RIVER:
-            # River clusters: similar to roads
-            # Early: 1 row, Mid: 1-2, Late: 1-3
-            if progress < 0.3:
-                return 1
-            elif progress < 0.6:
-                return random.randint(1, 2)
-            else:
-                return random.randint(1, 3)
-        
-        elif terrain_type == TERRAIN_TRAIN:
-            # Train clusters: always 1 (trains are deadly)
-            return 1
-        
-        return 1
+        bucket = 0 if progress < 0.3 else 1 if progress < 0.6 else 2
+        lo, hi = _CLUSTER_RANGES[terrain_type][bucket]
+        span = hi - lo
+        if span == 0:
+            return lo
+        if span == 1:
+            # A two-value range needs one random bit, not randint's
+            # generic range machinery
+            return lo + self.rng.getrandbits(1)
+        return self.rng.randint(lo, hi)
 
     def _generate_terrain(self):
+        """Generate terrain into this manager's own row buffer."""
+        self._generate_into(self.terrain_types)
+
+    def _generate_into(self, terrain_types):
         """
         Generate all terrain rows upfront with progressive difficulty.
-        
+
         Terrain is generated in clusters, with grass breaks between
         dangerous terrain types to prevent overwhelming sequences.
+
+        Args:
+            terrain_types: bytearray of TOTAL_ROWS terrain codes to fill
         """
+        # Bind hot lookups to locals for the generation loop
+        rng = self.rng
+        progress_table = self._progress
+        pick_terrain_type = self._pick_terrain_type
+        get_cluster_size = self._get_cluster_size
+        grass = TERRAIN_GRASS
+
         # Start with safe grass rows at the bottom
         safe_rows = 5
         for i in range(TOTAL_ROWS - safe_rows, TOTAL_ROWS):
-            self.rows.append(TerrainRow(i, TERRAIN_GRASS))
-        
+            terrain_types[i] = grass
+
         # Generate terrain in clusters from bottom to top (high row numbers to low)
         current_row = TOTAL_ROWS - safe_rows - 1
-        last_terrain_type = TERRAIN_GRASS  # Track previous terrain for spacing
-        
+        last_terrain_type = grass  # Track previous terrain for spacing
+
         while current_row >= 0:
-            progress = self._get_progress(current_row)
-            probabilities = self._get_terrain_probabilities(progress)
-            terrain_type = self._pick_terrain_type(probabilities)
+            progress = progress_table[current_row]
+            terrain_type = pick_terrain_type(current_row)
             
             # If we just had dangerous terrain and picked dangerous terrain again,
-            # insert a grass break first (higher chance at low progress)
-            is_dangerous = terrain_type in (TERRAIN_ROAD, TERRAIN_RIVER, TERRAIN_TRAIN)
-            was_dangerous = last_terrain_type in (TERRAIN_ROAD, TERRAIN_RIVER, TERRAIN_TRAIN)
+            # insert a grass break first (higher chance at low progress).
+            # Everything except grass is dangerous, so one compare suffices
+            is_dangerous = terrain_type != grass
+            was_dangerous = last_terrain_type != grass
             
             if is_dangerous and was_dangerous:
                 # Insert grass break between dangerous terrain clusters
                 # Early game: always insert grass break
                 # Late game: 50% chance of grass break
                 grass_break_chance = 1.0 - (0.5 * progress)  # 100% -> 50%
-                if random.random() < grass_break_chance:
+                if rng.random() < grass_break_chance:
                     # Insert 1-2 rows of grass
-                    grass_size = random.randint(1, 2)
+                    grass_size = 1 + rng.getrandbits(1)
                     grass_size = min(grass_size, current_row + 1)
                     for i in range(grass_size):
                         row_num = current_row - i
                         if row_num >= 0:
-                            self.rows.append(TerrainRow(row_num, TERRAIN_GRASS))
+                            terrain_types[row_num] = grass
                     current_row -= grass_size
-                    last_terrain_type = TERRAIN_GRASS
+                    last_terrain_type = grass
                     continue
-            
+
             # Generate the terrain cluster
-            cluster_size = self._get_cluster_size(terrain_type, progress)
+            cluster_size = get_cluster_size(terrain_type, progress)
             cluster_size = min(cluster_size, current_row + 1)
             
             for i in range(cluster_size):
                 row_num = current_row - i
                 if row_num >= 0:
-                    self.rows.append(TerrainRow(row_num, terrain_type))
+                    terrain_types[row_num] = terrain_type
             
             current_row -= cluster_size
             last_terrain_type = terrain_type
-        
-        # Sort rows by row_num so they're in correct order
-        self.rows.sort(key=lambda r: r.row_num)
 
     def get_terrain_at(self, grid_y):
         """
@@ -219,13 +307,19 @@ class TerrainManager:
             grid_y: Y coordinate in grid space
         
         Returns:
-            str: Terrain type or None if out of bounds
+            int: Terrain type code or None if out of bounds
         """
-        if 0 <= grid_y < len(self.rows):
-            return self.rows[grid_y].terrain_type
+        if 0 <= grid_y < self.num_rows:
+            return self.terrain_types[grid_y]
         return None
 
     def reset(self):
-        """Reset terrain to initial state."""
-        self.rows.clear()
-        self._generate_terrain()
+        """Reset terrain to a fresh layout."""
+        if self.seed is not None:
+            # Seeded terrain is deterministic; keep the same layout
+            return
+        try:
+            # Swap in a pregenerated terrain; the pool thread refills it
+            self.terrain_types = self._pool.get_nowait()
+        except Empty:
+            self._generate_terrain()